@@ -139,6 +139,8 @@ class HomogenizationModel(DiffusionModel):
         (p, e+1, N) array - p is number of phases, e is number of elements, N is number of nodes
         '''
         mob = self.defaultMob * np.ones((len(self.phases), len(self.elements)+1, xarray.shape[1]))
+        #Composition of all elements (including reference) at each node
+        xfull = np.concatenate(([1-np.sum(xarray, axis=0)], xarray), axis=0)
         for i in range(xarray.shape[1]):
             if self.cache:
                 hashValue = self._getHash(xarray[:,i], self.T[i])
@@ -157,7 +159,7 @@ class HomogenizationModel(DiffusionModel):
                             #print(self.phases, self.phases[p], xarray[:,i], self.p[:,i], i, self.compSets[i])
                             compset = [cs for cs in self.compSets[i] if cs.phase_record.phase_name == self.phases[p]][0]
                             mob[p,:,i] = mobility_from_composition_set(compset, self.therm.mobCallables[self.phases[p]], self.therm.mobility_correction)[self.unsortIndices]
-                            mob[p,:,i] *= np.concatenate(([1-np.sum(xarray[:,i])], xarray[:,i]))
+                            mob[p,:,i] *= xfull[:,i]
                         else:
                             mob[p,:,i] = -1
                 for p in range(len(self.phases)):
@@ -293,9 +295,7 @@ class HomogenizationModel(DiffusionModel):
         fluxes = -avgMob * dmudz
         nonzeroComp = avgX != 0
         Tmid = (self.T[1:] + self.T[:-1]) / 2
-        Tmidfull = Tmid[np.newaxis,:]
-        for i in range(fluxes.shape[0]-1):
-            Tmidfull = np.concatenate((Tmidfull, Tmid[np.newaxis,:]), axis=0)
+        Tmidfull = np.tile(Tmid, (fluxes.shape[0], 1))
         fluxes[nonzeroComp] += -self.eps * avgMob[nonzeroComp] * 8.314 * Tmidfull[nonzeroComp] * dxdz[nonzeroComp] / avgX[nonzeroComp]
 
         #Flux in a volume fixed frame: J_vi = J_i - x_i * sum(J_j)
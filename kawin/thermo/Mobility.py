@@ -124,6 +124,9 @@ class MobilityModel(Model):
 
         for c in self.components:
             if c.name != 'VA':
+                #Collect redlich kister terms for each parameter type and sum them at the end
+                #   This avoids creating (and simplifying) an intermediate expression for each addition
+                rk_terms = {name: [] for name in param_names}
                 for name in param_names:
                     param_query = (
                         (where('phase_name') == phase.name) & \
@@ -131,11 +134,7 @@ class MobilityModel(Model):
                         (where('constituent_array').test(self._mobility_validity)) & \
                         (where('diffusing_species') == c)
                     )
-                    rk = self.redlich_kister_sum(phase, param_search, param_query)
-
-                    if name not in self.mob_models:
-                        self.mob_models[name] = {}
-                    self.mob_models[name][c.name] = rk
+                    rk_terms[name].append(self.redlich_kister_sum(phase, param_search, param_query))
 
                 #Additional parameters search if diffusing species are not included
                 #   This is mainly intended to help with parameter fitting
@@ -151,8 +150,12 @@ class MobilityModel(Model):
                         (where('parameter_type') == fit_name) & \
                         (where('constituent_array').test(self._mobility_validity))
                     )
-                    rk = self.redlich_kister_sum(phase, param_search, param_query)
-                    self.mob_models[p[1]][c.name] += rk
+                    rk_terms[p[1]].append(self.redlich_kister_sum(phase, param_search, param_query))
+
+                for name in param_names:
+                    if name not in self.mob_models:
+                        self.mob_models[name] = {}
+                    self.mob_models[name][c.name] = Add(*rk_terms[name])
 
         self.checkOrderingContribution(dbe)
         for c in self.components:
@@ -150,9 +150,12 @@ class GeneralThermodynamics:
         phase_mob_params = {}
         phase_diff_params = {}
         self.mobModels = {}
+
+        #Scan the database once for all mobility/diffusivity parameters
+        #   The phase specific queries below are then only tested against this subset
+        mob_diff_params = self.db.search(where('parameter_type').test(lambda t: t in ['MQ', 'MF', 'DQ', 'DF']))
         for p in self.phases:
             #Get mobility/diffusivity of phase p if exists
-            param_search = self.db.search
             param_query_mob = (
                 (where('phase_name') == p) & \
                 (where('parameter_type') == 'MQ') | \
@@ -164,8 +167,8 @@ class GeneralThermodynamics:
                 (where('parameter_type') == 'DQ') | \
                 (where('parameter_type') == 'DF')
             )
-            phase_mob_params[p] = param_search(param_query_mob)
-            phase_diff_params[p] = param_search(param_query_diff)
+            phase_mob_params[p] = [param for param in mob_diff_params if param_query_mob(param)]
+            phase_diff_params[p] = [param for param in mob_diff_params if param_query_diff(param)]
 
             if len(phase_mob_params[p]) > 0 or len(phase_diff_params[p]) > 0:
                 self.mobModels[p] = MobilityModel(self.db, self.elements, p, parameters=param_keys)